@@ -4,6 +4,7 @@
 
 
 import argparse
+import atexit
 import importlib
 import logging
 import os.path
@@ -11,6 +12,8 @@ import sys
 import tempfile
 from typing import Iterable, List
 
+import orjson
+
 from airbyte_cdk.logger import AirbyteLogFormatter, init_logger
 from airbyte_cdk.models import AirbyteMessage, Status, Type
 from airbyte_cdk.sources import Source
@@ -19,6 +22,15 @@ from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets
 
 logger = init_logger("airbyte")
 
+# Serialized RECORD messages all start with this prefix. They are the only
+# high-volume message type, which makes them the only type that is safe to hold
+# back in the stdout buffer instead of flushing right away.
+_RECORD_MESSAGE_PREFIX = '{"type":"RECORD"'
+
+# Number of serialized RECORD messages accumulated before they are handed to
+# stdout in a single writelines() call.
+_RECORD_BATCH_SIZE = 64
+
 
 class AirbyteEntrypoint(object):
     def __init__(self, source: Source):
@@ -104,8 +116,28 @@ class AirbyteEntrypoint(object):
                     config_catalog = self.source.read_catalog(parsed_args.catalog)
                     state = self.source.read_state(parsed_args.state)
                     generator = self.source.read(self.logger, config, config_catalog, state)
+                    # orjson is significantly faster than pydantic's json() on
+                    # large payloads, and this loop runs once per record. For
+                    # RECORD messages the envelope around the data is constant
+                    # per stream, so it is serialized once and only the variable
+                    # fields are encoded per record; output is byte-identical to
+                    # serializing the whole envelope. STATE and LOG messages are
+                    # infrequent and keep the generic path.
+                    record_prefixes = {}
                     for message in generator:
-                        yield message.json(exclude_unset=True)
+                        if message.type == Type.RECORD:
+                            record = message.record
+                            prefix = record_prefixes.get(record.stream)
+                            if prefix is None:
+                                stream_json = orjson.dumps(record.stream).decode()
+                                prefix = f'{{"type":"RECORD","record":{{"stream":{stream_json},"data":'
+                                record_prefixes[record.stream] = prefix
+                            serialized = f'{prefix}{orjson.dumps(record.data).decode()},"emitted_at":{record.emitted_at}'
+                            if record.namespace is not None:
+                                serialized += f',"namespace":{orjson.dumps(record.namespace).decode()}'
+                            yield serialized + "}}"
+                        else:
+                            yield orjson.dumps(message.dict(exclude_unset=True)).decode()
                 else:
                     raise Exception("Unexpected command " + cmd)
 
@@ -113,8 +145,29 @@ class AirbyteEntrypoint(object):
 def launch(source: Source, args: List[str]):
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    for message in source_entrypoint.run(parsed_args):
-        print(message)
+    # Emitting messages one write at a time dominates kernel-mode CPU on
+    # record-heavy syncs. Records accumulate into batches handed to stdout with
+    # a single writelines() call; the rare non-RECORD messages (STATE
+    # checkpoints, catalogs, connection statuses) drain the batch and force a
+    # flush so they are never held back behind buffered records.
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    atexit.register(sys.stdout.flush)
+    batch = []
+    try:
+        for message in source_entrypoint.run(parsed_args):
+            batch.append(message + "\n")
+            if not message.startswith(_RECORD_MESSAGE_PREFIX):
+                sys.stdout.writelines(batch)
+                batch.clear()
+                sys.stdout.flush()
+            elif len(batch) >= _RECORD_BATCH_SIZE:
+                sys.stdout.writelines(batch)
+                batch.clear()
+    finally:
+        # emit whatever is pending even if the source generator raised
+        sys.stdout.writelines(batch)
+        sys.stdout.flush()
 
 
 def main():
@@ -4,15 +4,36 @@
 
 import logging
 import logging.config
+import re
 import sys
 import traceback
 from functools import partial
 from typing import List
 
+import orjson
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage
 
 TRACE_LEVEL_NUM = 5
 
+# Airbyte protocol log levels; a frozenset makes the per-message membership
+# test in log_by_prefix an O(1) hash lookup
+_VALID_LOG_TYPES = frozenset({"FATAL", "ERROR", "WARN", "INFO", "DEBUG", "TRACE"})
+
+# The LOG envelope is constant per level, so it is rendered once here and only
+# the message is JSON-encoded per call. Output matches serializing a full
+# AirbyteMessage with exclude_unset byte for byte.
+_LOG_MESSAGE_PREFIXES = {level: f'{{"type":"LOG","log":{{"level":"{level}","message":' for level in _VALID_LOG_TYPES}
+
+# Transforming Python log levels to Airbyte protocol log levels
+LEVEL_MAPPING = {
+    logging.FATAL: "FATAL",
+    logging.ERROR: "ERROR",
+    logging.WARNING: "WARN",
+    logging.INFO: "INFO",
+    logging.DEBUG: "DEBUG",
+    TRACE_LEVEL_NUM: "TRACE",
+}
+
 LOGGING_CONFIG = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -64,30 +85,33 @@ class AirbyteLogFormatter(logging.Formatter):
     """Output log records using AirbyteMessage"""
 
     _secrets = []
+    _secrets_pattern = None
 
     @classmethod
     def update_secrets(cls, secrets: List[str]):
         """Update the list of secrets to be replaced in the log message"""
         cls._secrets = secrets
+        # A single compiled alternation masks all secrets in one pass over the
+        # message instead of one str.replace scan per secret. Longest secrets
+        # go first so a secret that contains another one is masked completely.
+        if secrets:
+            cls._secrets_pattern = re.compile("|".join(re.escape(secret) for secret in sorted(secrets, key=len, reverse=True)))
+        else:
+            cls._secrets_pattern = None
 
-    # Transforming Python log levels to Airbyte protocol log levels
-    level_mapping = {
-        logging.FATAL: "FATAL",
-        logging.ERROR: "ERROR",
-        logging.WARNING: "WARN",
-        logging.INFO: "INFO",
-        logging.DEBUG: "DEBUG",
-        TRACE_LEVEL_NUM: "TRACE",
-    }
+    # Kept for backwards compatibility; format() reads the module-level
+    # constant directly, which is a cheaper lookup than an attribute chain.
+    level_mapping = LEVEL_MAPPING
 
     def format(self, record: logging.LogRecord) -> str:
         """Return a JSON representation of the log message"""
         message = super().format(record)
-        airbyte_level = self.level_mapping.get(record.levelno, "INFO")
-        for secret in AirbyteLogFormatter._secrets:
-            message = message.replace(secret, "****")
-        log_message = AirbyteMessage(type="LOG", log=AirbyteLogMessage(level=airbyte_level, message=message))
-        return log_message.json(exclude_unset=True)
+        airbyte_level = LEVEL_MAPPING.get(record.levelno, "INFO")
+        if AirbyteLogFormatter._secrets_pattern:
+            message = AirbyteLogFormatter._secrets_pattern.sub("****", message)
+        # construct() skips validation, which these internally produced values do not need
+        log_message = AirbyteMessage.construct(type="LOG", log=AirbyteLogMessage.construct(level=airbyte_level, message=message))
+        return orjson.dumps(log_message.dict(exclude_unset=True)).decode()
 
 
 class AirbyteNativeLogger(logging.Logger):
@@ -95,17 +119,18 @@ class AirbyteNativeLogger(logging.Logger):
 
     def __init__(self, name):
         super().__init__(name)
-        self.valid_log_types = ["FATAL", "ERROR", "WARN", "INFO", "DEBUG", "TRACE"]
+        self.valid_log_types = _VALID_LOG_TYPES
 
     def log_by_prefix(self, msg, default_level):
         """Custom method, which takes log level from first word of message"""
-        split_line = msg.split()
-        first_word = next(iter(split_line), None)
-        if first_word in self.valid_log_types:
+        # partition does constant work in the common case where the first word
+        # is not a log level, instead of splitting and re-joining the message
+        first_word, _, rest = msg.partition(" ")
+        if first_word in _VALID_LOG_TYPES:
             log_level = logging.getLevelName(first_word)
-            rendered_message = " ".join(split_line[1:])
+            rendered_message = rest.strip()
         else:
-            default_level = default_level if default_level in self.valid_log_types else "INFO"
+            default_level = default_level if default_level in _VALID_LOG_TYPES else "INFO"
             log_level = logging.getLevelName(default_level)
             rendered_message = msg
         self.log(log_level, rendered_message)
@@ -116,43 +141,52 @@ class AirbyteNativeLogger(logging.Logger):
 
 class AirbyteLogger:
     def __init__(self):
-        self.valid_log_types = ["FATAL", "ERROR", "WARN", "INFO", "DEBUG", "TRACE"]
+        self.valid_log_types = _VALID_LOG_TYPES
 
     def log_by_prefix(self, message, default_level):
         """Custom method, which takes log level from first word of message"""
-        split_line = message.split()
-        first_word = next(iter(split_line), None)
-        if first_word in self.valid_log_types:
+        first_word, _, rest = message.partition(" ")
+        if first_word in _VALID_LOG_TYPES:
             log_level = first_word
-            rendered_message = " ".join(split_line[1:])
+            rendered_message = rest.strip()
         else:
             log_level = default_level
             rendered_message = message
         self.log(log_level, rendered_message)
 
-    def log(self, level, message):
-        log_record = AirbyteLogMessage(level=level, message=message)
-        log_message = AirbyteMessage(type="LOG", log=log_record)
-        print(log_message.json(exclude_unset=True))
-
-    def fatal(self, message):
-        self.log("FATAL", message)
-
-    def exception(self, message):
-        message = f"{message}\n{traceback.format_exc()}"
-        self.error(message)
+    def log(self, level, message, *args):
+        # mirror the native logger's deferred %-formatting so call sites can share
+        # the same format strings with logging.Logger
+        if args:
+            message = message % args
+        prefix = _LOG_MESSAGE_PREFIXES.get(level)
+        if prefix is None:
+            prefix = f'{{"type":"LOG","log":{{"level":"{level}","message":'
+        print(f"{prefix}{orjson.dumps(message).decode()}}}}}")
+
+    def fatal(self, message, *args):
+        self.log("FATAL", message, *args)
+
+    def exception(self, message, *args):
+        if args:
+            message = message % args
+        # only pay for formatting a traceback when an exception is actually active
+        if sys.exc_info()[0] is None:
+            self.error(message)
+            return
+        self.error(f"{message}\n{traceback.format_exc()}")
 
-    def error(self, message):
-        self.log("ERROR", message)
+    def error(self, message, *args):
+        self.log("ERROR", message, *args)
 
-    def warn(self, message):
-        self.log("WARN", message)
+    def warn(self, message, *args):
+        self.log("WARN", message, *args)
 
-    def info(self, message):
-        self.log("INFO", message)
+    def info(self, message, *args):
+        self.log("INFO", message, *args)
 
-    def debug(self, message):
-        self.log("DEBUG", message)
+    def debug(self, message, *args):
+        self.log("DEBUG", message, *args)
 
-    def trace(self, message):
-        self.log("TRACE", message)
+    def trace(self, message, *args):
+        self.log("TRACE", message, *args)
@@ -3,10 +3,10 @@
 #
 
 
-import copy
-from datetime import datetime
+import time
 from typing import Any, Iterable, Mapping, MutableMapping, Type
 
+import orjson
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import (
     AirbyteCatalog,
@@ -60,17 +60,18 @@ class BaseSource(Source):
         state = state or {}
         client = self._get_client(config)
 
-        logger.info(f"Starting syncing {self.name}")
-        total_state = copy.deepcopy(state)
+        logger.info("Starting syncing %s", self.name)
+        # state is JSON by contract; orjson round-trips it faster than deepcopy
+        total_state = orjson.loads(orjson.dumps(state)) if state else {}
         for configured_stream in catalog.streams:
             try:
                 yield from self._read_stream(logger=logger, client=client, configured_stream=configured_stream, state=total_state)
 
             except Exception:
-                logger.exception(f"Encountered an exception while reading stream {self.name}")
+                logger.exception("Encountered an exception while reading stream %s", self.name)
                 raise
 
-        logger.info(f"Finished syncing {self.name}")
+        logger.info("Finished syncing %s", self.name)
 
     def _read_stream(
         self, logger: AirbyteLogger, client: BaseClient, configured_stream: ConfiguredAirbyteStream, state: MutableMapping[str, Any]
@@ -79,14 +80,16 @@ class BaseSource(Source):
         use_incremental = configured_stream.sync_mode == SyncMode.incremental and client.stream_has_state(stream_name)
 
         if use_incremental and state.get(stream_name):
-            logger.info(f"Set state of {stream_name} stream to {state.get(stream_name)}")
+            logger.info("Set state of %s stream to %s", stream_name, state.get(stream_name))
             client.set_stream_state(stream_name, state.get(stream_name))
 
-        logger.info(f"Syncing {stream_name} stream")
+        logger.info("Syncing %s stream", stream_name)
         for record in client.read_stream(configured_stream.stream):
-            now = int(datetime.now().timestamp()) * 1000
-            message = AirbyteRecordMessage(stream=stream_name, data=record, emitted_at=now)
-            yield AirbyteMessage(type=MessageType.RECORD, record=message)
+            now = time.time_ns() // 1_000_000
+            # construct() skips validation, which is redundant for internally
+            # produced values and costs real time per record
+            message = AirbyteRecordMessage.construct(stream=stream_name, data=record, emitted_at=now)
+            yield AirbyteMessage.construct(type=MessageType.RECORD, record=message)
 
         if use_incremental and client.get_stream_state(stream_name):
             state[stream_name] = client.get_stream_state(stream_name)
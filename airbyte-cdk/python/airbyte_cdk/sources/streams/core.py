@@ -65,10 +65,13 @@ class Stream(ABC):
     def as_airbyte_stream(self) -> AirbyteStream:
         stream = AirbyteStream(name=self.name, json_schema=dict(self.get_json_schema()), supported_sync_modes=[SyncMode.full_refresh])
 
-        if self.supports_incremental:
+        # cursor_field may be a computed property, so resolve it once and reuse it
+        # both for the incremental classification and as the default cursor
+        wrapped_cursor_field = self._wrapped_cursor_field()
+        if wrapped_cursor_field:
             stream.source_defined_cursor = self.source_defined_cursor
             stream.supported_sync_modes.append(SyncMode.incremental)  # type: ignore
-            stream.default_cursor_field = self._wrapped_cursor_field()
+            stream.default_cursor_field = wrapped_cursor_field
 
         keys = Stream._wrapped_primary_key(self.primary_key)
         if keys and len(keys) > 0:
@@ -4,9 +4,12 @@
 
 
 import re
+from functools import lru_cache
 
 
 # https://stackoverflow.com/a/1176023
+# Stream.name calls this for every access, so memoize the regex work.
+@lru_cache(maxsize=None)
 def camel_to_snake(s):
     s = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", s)
     return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s).lower()
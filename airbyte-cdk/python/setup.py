@@ -48,6 +48,7 @@ setup(
         "backoff",
         "jsonschema~=3.2.0",
         "jsonref~=0.2",
+        "orjson",
         "pendulum",
         "pydantic~=1.6",
         "PyYAML~=5.4",
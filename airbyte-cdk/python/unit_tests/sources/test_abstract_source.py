@@ -190,6 +190,28 @@ def test_valid_full_refresh_read_with_slices(mocker, logger):
     assert expected == messages
 
 
+def test_valid_full_refresh_read_concurrently(mocker, logger):
+    """Tests that a full refresh sync with the _parallelism internal config produces the same messages as a sequential sync, in any order"""
+    stream_output = [{"k1": "v1"}, {"k2": "v2"}]
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, stream_output)], name="s1")
+    s2 = MockStream([({"sync_mode": SyncMode.full_refresh}, stream_output)], name="s2")
+
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+
+    src = MockSource(streams=[s1, s2])
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(s1, SyncMode.full_refresh), _configured_stream(s2, SyncMode.full_refresh)]
+    )
+
+    expected = _as_records("s1", stream_output) + _as_records("s2", stream_output)
+    messages = _fix_emitted_at(list(src.read(logger, {"_parallelism": 2}, catalog)))
+
+    # streams interleave arbitrarily, but every expected message must be present exactly once
+    assert len(expected) == len(messages)
+    for message in expected:
+        assert message in messages
+
+
 def _state(state_data: Dict[str, Any]):
     return AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data=state_data))
 
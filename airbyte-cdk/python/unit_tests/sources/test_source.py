@@ -179,7 +179,8 @@ def test_internal_config_limit(abstract_source, catalog):
     catalog.streams[0].sync_mode = SyncMode.full_refresh
     records = [r for r in abstract_source.read(logger=logger_mock, config=internal_config, catalog=catalog, state={})]
     assert len(records) == STREAM_LIMIT
-    logger_info_args = [call[0][0] for call in logger_mock.info.call_args_list]
+    # render deferred %-style format args the same way the logger would
+    logger_info_args = [call[0][0] % call[0][1:] for call in logger_mock.info.call_args_list]
     # Check if log line matches number of limit
     read_log_record = [_l for _l in logger_info_args if _l.startswith("Read")]
     assert read_log_record[0].startswith(f"Read {STREAM_LIMIT} ")
@@ -195,7 +196,8 @@ def test_internal_config_limit(abstract_source, catalog):
     records = [r for r in abstract_source.read(logger=logger_mock, config=internal_config, catalog=catalog, state={})]
     assert len(records) == STREAM_LIMIT + 1
     assert records[-1].type == Type.STATE
-    logger_info_args = [call[0][0] for call in logger_mock.info.call_args_list]
+    # render deferred %-style format args the same way the logger would
+    logger_info_args = [call[0][0] % call[0][1:] for call in logger_mock.info.call_args_list]
     read_log_record = [_l for _l in logger_info_args if _l.startswith("Read")]
     assert read_log_record[0].startswith(f"Read {STREAM_LIMIT} ")
 
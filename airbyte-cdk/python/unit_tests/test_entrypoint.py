@@ -8,6 +8,7 @@ from copy import deepcopy
 from typing import Any, List, Mapping, MutableMapping, Union
 from unittest.mock import MagicMock
 
+import orjson
 import pytest
 from airbyte_cdk import AirbyteEntrypoint
 from airbyte_cdk.models import (
@@ -96,7 +97,9 @@ def _wrap_message(submessage: Union[AirbyteConnectionStatus, ConnectorSpecificat
     elif isinstance(submessage, AirbyteCatalog):
         message = AirbyteMessage(type=Type.CATALOG, catalog=submessage)
     elif isinstance(submessage, AirbyteRecordMessage):
+        # messages produced by `read` are serialized with orjson
         message = AirbyteMessage(type=Type.RECORD, record=submessage)
+        return orjson.dumps(message.dict(exclude_unset=True)).decode()
     else:
         raise Exception(f"Unknown message type: {submessage}")
 
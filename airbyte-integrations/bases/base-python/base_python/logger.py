@@ -14,7 +14,7 @@ class AirbyteLogger:
 
     def log_by_prefix(self, message, default_level):
         split_line = message.split()
-        first_word = next(iter(split_line), None)
+        first_word = split_line[0] if split_line else None
         if first_word in self.valid_log_types:
             log_level = first_word
             rendered_message = " ".join(split_line[1:])